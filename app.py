@@ -19,11 +19,11 @@ import streamlit as st
 from pathlib import Path
 import uuid
 from datetime import datetime
-import sys
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
-sys.path.append(str(Path(__file__).parent / "utils"))
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+import hashlib
+import os
+import shutil
 
 from src.document_processor import DocumentProcessor
 from utils.db_manager import get_db
@@ -93,13 +93,36 @@ st.markdown("""
 # SESSION STATE INITIALIZATION
 # ============================================================
 
+@st.cache_resource
+def get_processor() -> DocumentProcessor:
+    """Create the document processor once and share it across sessions."""
+    return DocumentProcessor(ocr_cache=get_db())
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Thread pool for document processing, shared across sessions."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_recent_documents(limit: int = 5) -> List[Dict]:
+    """
+    Recently uploaded documents for the sidebar.
+    
+    Cached so reruns don't query SQLite on every widget interaction;
+    cleared whenever a new document is processed.
+    """
+    return get_db().get_uploaded_documents(limit=limit)
+
+
 def init_session_state():
     """Initialize session state variables."""
     if 'session_id' not in st.session_state:
         st.session_state.session_id = str(uuid.uuid4())
     
     if 'processor' not in st.session_state:
-        st.session_state.processor = DocumentProcessor()
+        st.session_state.processor = get_processor()
     
     if 'db' not in st.session_state:
         st.session_state.db = get_db()
@@ -110,6 +133,12 @@ def init_session_state():
     if 'extracted_text' not in st.session_state:
         st.session_state.extracted_text = None
     
+    if 'text_stats' not in st.session_state:
+        st.session_state.text_stats = None
+    
+    if 'extracted_preview' not in st.session_state:
+        st.session_state.extracted_preview = None
+    
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
 
@@ -118,6 +147,8 @@ def init_session_state():
 # HELPER FUNCTIONS
 # ============================================================
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 def save_uploaded_file(uploaded_file) -> Path:
     """
     Save uploaded file to disk.
@@ -133,27 +164,107 @@ def save_uploaded_file(uploaded_file) -> Path:
     
     file_path = upload_dir / uploaded_file.name
     
+    # Stream to disk in 64 KB chunks rather than copying the whole buffer
+    uploaded_file.seek(0)
     with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
     
     return file_path
 
 
-def process_uploaded_document(file_path: Path):
+def compute_text_stats(text: str) -> Dict:
+    """
+    Character, word and line counts for the Extracted Text tab.
+    
+    Computed once when a document is processed rather than on every rerun.
+    """
+    return {
+        'chars': len(text),
+        'words': len(text.split()),
+        'lines': text.count('\n') + 1,
+    }
+
+
+class _ProcessingFailed(Exception):
+    """Carries a failed process_document() result out of the cached call."""
+    
+    def __init__(self, result: Dict):
+        super().__init__(result.get('error'))
+        self.result = result
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def process_document_cached(_processor: DocumentProcessor, file_hash: str, file_path: str) -> Dict:
+    """
+    Process a document, memoized on its content hash and path.
+    
+    Re-uploading an identical file skips OCR/PDF extraction entirely.
+    The processor argument is not part of the cache key. Failures raise
+    _ProcessingFailed so they are not memoized and a retry runs again.
+    """
+    result = _processor.process_document(file_path)
+    if not result['success']:
+        raise _ProcessingFailed(result)
+    return result
+
+
+def make_preview(text: str, length: int = 1000) -> str:
+    """First `length` characters of the text, with an ellipsis if truncated."""
+    return text[:length] + ("..." if len(text) > length else "")
+
+
+def _save_and_process(processor: DocumentProcessor, uploaded_file) -> Dict:
     """
-    Process uploaded document and update session state.
+    Save an uploaded file and extract its text.
+    
+    Runs on a worker thread, so it must not touch st.session_state.
     
     Args:
-        file_path: Path to the uploaded file
+        processor: Shared document processor
+        uploaded_file: Streamlit uploaded file object
+        
+    Returns:
+        Result dictionary from process_document()
+    """
+    file_hash = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+    file_path = save_uploaded_file(uploaded_file)
+    try:
+        return process_document_cached(processor, file_hash, str(file_path))
+    except _ProcessingFailed as e:
+        return e.result
+
+
+def process_uploaded_documents(uploaded_files: List) -> List[Dict]:
     """
-    with st.spinner("🔄 Processing document..."):
-        # Process document
-        result = st.session_state.processor.process_document(file_path)
+    Process uploaded documents concurrently and update session state.
+    
+    OCR and PDF parsing run on the shared thread pool; database writes
+    and session state updates happen here on the script thread.
+    
+    Args:
+        uploaded_files: Streamlit uploaded file objects
         
-        if result['success']:
-            # Save to session state
-            st.session_state.current_document = result['file_name']
-            st.session_state.extracted_text = result['text']
+    Returns:
+        Result dictionaries, in upload order
+    """
+    processor = st.session_state.processor
+    executor = get_executor()
+    results = [None] * len(uploaded_files)
+    
+    with st.spinner(f"🔄 Processing {len(uploaded_files)} document(s)..."):
+        futures = {
+            executor.submit(_save_and_process, processor, uploaded_file): i
+            for i, uploaded_file in enumerate(uploaded_files)
+        }
+        
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            
+            if not result['success']:
+                continue
+            
+            st.write(f"✅ Processed: {result['file_name']}")
             
             # Save to database
             doc_id = st.session_state.db.save_document_metadata(
@@ -164,14 +275,22 @@ def process_uploaded_document(file_path: Path):
             )
             
             # Save processed text
-            st.session_state.processor.save_extracted_text(
+            processor.save_extracted_text(
                 result, 
                 Path("data/processed")
             )
-            
-            return True, result
-        else:
-            return False, result
+    
+    # The last successful upload becomes the current document
+    for result in reversed(results):
+        if result['success']:
+            st.session_state.current_document = result['file_name']
+            st.session_state.extracted_text = result['text']
+            st.session_state.text_stats = compute_text_stats(result['text'])
+            st.session_state.extracted_preview = make_preview(result['text'])
+            get_recent_documents.clear()
+            break
+    
+    return results
 
 
 # ============================================================
@@ -192,33 +311,33 @@ def main():
     with st.sidebar:
         st.header("📄 Document Upload")
         
-        uploaded_file = st.file_uploader(
-            "Upload financial document",
+        uploaded_files = st.file_uploader(
+            "Upload financial documents",
             type=['pdf', 'png', 'jpg', 'jpeg', 'tiff'],
+            accept_multiple_files=True,
             help="Supports PDFs, scanned images, and photos"
         )
         
-        if uploaded_file:
-            st.success(f"✅ File uploaded: {uploaded_file.name}")
+        if uploaded_files:
+            for uploaded_file in uploaded_files:
+                st.success(f"✅ File uploaded: {uploaded_file.name}")
             
             if st.button("🚀 Process Document", type="primary"):
-                # Save file
-                file_path = save_uploaded_file(uploaded_file)
-                
-                # Process document
-                success, result = process_uploaded_document(file_path)
+                results = process_uploaded_documents(uploaded_files)
+                failed = [r for r in results if not r['success']]
                 
-                if success:
-                    st.success("✅ Document processed successfully!")
+                if not failed:
+                    st.success("✅ Documents processed successfully!")
                     st.rerun()
                 else:
-                    st.error(f"❌ Error: {result['error']}")
+                    for result in failed:
+                        st.error(f"❌ Error ({result['file_name']}): {result['error']}")
         
         st.divider()
         
         # Document history
         st.header("📚 Recent Documents")
-        docs = st.session_state.db.get_uploaded_documents(limit=5)
+        docs = get_recent_documents(limit=5)
         
         if docs:
             for doc in docs:
@@ -354,15 +473,14 @@ def main():
             
             if st.session_state.extracted_text:
                 # Show stats
+                stats = st.session_state.text_stats
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Characters", len(st.session_state.extracted_text))
+                    st.metric("Characters", stats['chars'])
                 with col2:
-                    word_count = len(st.session_state.extracted_text.split())
-                    st.metric("Words", word_count)
+                    st.metric("Words", stats['words'])
                 with col3:
-                    line_count = len(st.session_state.extracted_text.split('\n'))
-                    st.metric("Lines", line_count)
+                    st.metric("Lines", stats['lines'])
                 
                 st.divider()
                 
@@ -377,7 +495,7 @@ def main():
                 
                 # Show preview
                 st.subheader("Preview (first 1000 characters)")
-                st.text(st.session_state.extracted_text[:1000] + "...")
+                st.text(st.session_state.extracted_preview)
             else:
                 st.info("No text extracted yet")
         
@@ -0,0 +1 @@
+"""FinDoc Intelligence - document processing and data extraction."""
@@ -14,10 +14,229 @@ Handles:
 Author: Built for FinDoc Intelligence project
 """
 
+import io
+import mmap
+import os
 import re
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime
-import json
+
+import orjson
+
+
+# Regex patterns for financial data extraction, compiled once at import
+# and shared by every DataExtractor instance. Patterns only match spaces
+# and tabs (never newlines) so a label can't pick up a value from a later
+# line or section.
+_PATTERNS = {
+    # Company identifiers
+    'company_name': re.compile(
+        r'Company Name:[ \t]*(\S.*?)(?:\n|$)',
+        re.IGNORECASE
+    ),
+    'registration_number': re.compile(
+        r'Registration Number:[ \t]*(\d+)',
+        re.IGNORECASE
+    ),
+    'lei_code': re.compile(
+        r'LEI Code:[ \t]*([A-Z0-9]{20})',
+        re.IGNORECASE
+    ),
+    'duns_number': re.compile(
+        r'DUNS Number:[ \t]*(\d{9})',
+        re.IGNORECASE
+    ),
+    
+    # Credit metrics
+    'credit_score': re.compile(
+        r'Credit Score:[ \t]*(\d+)[ \t]*(?:/|out of)?[ \t]*\d*',
+        re.IGNORECASE
+    ),
+    'credit_rating': re.compile(
+        r'Credit Rating:[ \t]*([A-Z][A-Z+\-]*)',
+        re.IGNORECASE
+    ),
+    'credit_limit': re.compile(
+        r'Credit Limit[^\n]*?[£$€]?[ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'risk_level': re.compile(
+        r'Risk Level:[ \t]*(\S.*?)(?:\n|$)',
+        re.IGNORECASE
+    ),
+    
+    # Financial metrics
+    'revenue': re.compile(
+        r'Revenue[^\n]*?[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'turnover': re.compile(
+        r'Turnover[^\n]*?[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'profit': re.compile(
+        r'Profit Before Tax[^\n]*?[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'total_assets': re.compile(
+        r'Total Assets:[ \t]*[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'total_liabilities': re.compile(
+        r'Total Liabilities:[ \t]*[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    'net_worth': re.compile(
+        r'Net Worth:[ \t]*[£$€][ \t]*([\d,]+)',
+        re.IGNORECASE
+    ),
+    
+    # Financial ratios
+    'debt_to_equity': re.compile(
+        r'Debt-to-Equity[^\n]*?(\d+\.?\d*)',
+        re.IGNORECASE
+    ),
+    'current_ratio': re.compile(
+        r'Current Ratio:[ \t]*(\d+\.?\d*)',
+        re.IGNORECASE
+    ),
+    'profit_margin': re.compile(
+        r'Profit Margin:[ \t]*(\d+\.?\d*)%?',
+        re.IGNORECASE
+    ),
+    
+    # Payment information
+    'payment_terms': re.compile(
+        r'Payment Terms:[ \t]*(\S.*?)(?:\n|$)',
+        re.IGNORECASE
+    ),
+    'on_time_percentage': re.compile(
+        r'On-Time Payments?:[ \t]*\d+[ \t]*\((\d+)%\)',
+        re.IGNORECASE
+    ),
+    'average_payment_days': re.compile(
+        r'Average Payment Days:[ \t]*(\d+)',
+        re.IGNORECASE
+    ),
+    
+    # Dates
+    'incorporation_date': re.compile(
+        r'Date of Incorporation:[ \t]*(\d{1,2}[ \t]+\w+[ \t]+\d{4})',
+        re.IGNORECASE
+    ),
+    'report_date': re.compile(
+        r'Report Date:[ \t]*(\d{1,2}[ \t]+\w+[ \t]+\d{4})',
+        re.IGNORECASE
+    ),
+}
+
+# Fields written as a fixed "Label: value" line, keyed by the lower-cased
+# text before the first colon (which is also each pattern's literal label).
+# A one-pass line index finds them cheaply; labels elsewhere on a line
+# (bullets, two-column layouts) fall back to the field's own pattern.
+_LABEL_FIELDS = {
+    'company name': 'company_name',
+    'registration number': 'registration_number',
+    'lei code': 'lei_code',
+    'duns number': 'duns_number',
+    'credit score': 'credit_score',
+    'credit rating': 'credit_rating',
+    'risk level': 'risk_level',
+    'total assets': 'total_assets',
+    'total liabilities': 'total_liabilities',
+    'net worth': 'net_worth',
+    'current ratio': 'current_ratio',
+    'profit margin': 'profit_margin',
+    'payment terms': 'payment_terms',
+    'average payment days': 'average_payment_days',
+    'date of incorporation': 'incorporation_date',
+    'report date': 'report_date',
+}
+
+# Lower-cased label fragments; every label in _PATTERNS contains one of these
+_SIGNIFIERS = (
+    'company name', 'registration number', 'lei code', 'duns number',
+    'credit', 'risk level', 'revenue', 'turnover', 'profit',
+    'total assets', 'total liabilities', 'net worth', 'debt-to-equity',
+    'current ratio', 'payment', 'date of incorporation', 'report date',
+)
+
+# Remaining patterns (labels with qualifiers such as "Revenue (Turnover)"),
+# each searched on its own; searches stop at the first match, which for
+# these labels sits near the top of a report
+_SCAN_FIELDS = tuple(name for name in _PATTERNS if name not in _LABEL_FIELDS.values())
+
+
+_COMMA_STRIP = str.maketrans('', '', ',')
+
+
+def _to_amount(value: str) -> float:
+    """Convert a matched amount such as '4,850,000' to a float."""
+    return float(value.translate(_COMMA_STRIP))
+
+
+# Pattern name -> (category, output key, converter, display format)
+_FIELDS = {
+    # Company identifiers
+    'company_name': ('company_info', 'company_name', str.strip, 'plain'),
+    'registration_number': ('company_info', 'registration_number', str, 'plain'),
+    'lei_code': ('company_info', 'lei_code', str, 'plain'),
+    'duns_number': ('company_info', 'duns_number', str, 'plain'),
+    
+    # Credit metrics
+    'credit_score': ('credit_metrics', 'credit_score', int, 'plain'),
+    'credit_rating': ('credit_metrics', 'credit_rating', str, 'plain'),
+    'credit_limit': ('credit_metrics', 'credit_limit', _to_amount, 'currency'),
+    'risk_level': ('credit_metrics', 'risk_level', str.strip, 'plain'),
+    
+    # Financial metrics (Turnover is only used when Revenue is missing)
+    'revenue': ('financial_data', 'revenue', _to_amount, 'currency'),
+    'turnover': ('financial_data', 'revenue', _to_amount, 'currency'),
+    'profit': ('financial_data', 'profit', _to_amount, 'currency'),
+    'total_assets': ('financial_data', 'total_assets', _to_amount, 'currency'),
+    'total_liabilities': ('financial_data', 'total_liabilities', _to_amount, 'currency'),
+    'net_worth': ('financial_data', 'net_worth', _to_amount, 'currency'),
+    
+    # Financial ratios
+    'debt_to_equity': ('financial_data', 'debt_to_equity', float, 'plain'),
+    'current_ratio': ('financial_data', 'current_ratio', float, 'plain'),
+    'profit_margin': ('financial_data', 'profit_margin', float, 'plain'),
+    
+    # Payment information
+    'payment_terms': ('payment_info', 'payment_terms', str.strip, 'plain'),
+    'on_time_percentage': ('payment_info', 'on_time_percentage', int, 'percent'),
+    'average_payment_days': ('payment_info', 'average_payment_days', int, 'plain'),
+    
+    # Dates
+    'incorporation_date': ('dates', 'incorporation_date', str, 'plain'),
+    'report_date': ('dates', 'report_date', str, 'plain'),
+}
+
+_CATEGORIES = ('company_info', 'credit_metrics', 'financial_data', 'payment_info', 'dates')
+
+_FORMATTERS = {
+    'currency': lambda value: f"£{value:,.0f}",
+    'percent': lambda value: f"{value}%",
+    'plain': str,
+}
+
+# Output key -> (label, formatter) for format_for_display,
+# e.g. 'debt_to_equity' -> ('Debt To Equity', str)
+_DISPLAY = {
+    key: (key.replace('_', ' ').title(), _FORMATTERS[fmt])
+    for _, key, _, fmt in _FIELDS.values()
+}
+
+# Sections shown by format_for_display, in order
+_DISPLAY_SECTIONS = (
+    ('company_info', "📊 COMPANY INFORMATION\n"),
+    ('credit_metrics', "💳 CREDIT METRICS\n"),
+    ('financial_data', "💰 FINANCIAL DATA\n"),
+    ('payment_info', "💳 PAYMENT INFORMATION\n"),
+)
+
+_RULE = "=" * 80 + "\n"
+_SUBRULE = "-" * 80 + "\n"
 
 
 class DataExtractor:
@@ -30,120 +249,10 @@ class DataExtractor:
     
     def __init__(self):
         """Initialize the data extractor with pattern definitions."""
-        self.patterns = self._init_patterns()
+        self.patterns = _PATTERNS
         print("✅ DataExtractor initialized with financial patterns")
     
     
-    def _init_patterns(self) -> Dict:
-        """
-        Initialize regex patterns for financial data extraction.
-        
-        Returns:
-            Dictionary of compiled regex patterns
-        """
-        return {
-            # Company identifiers
-            'company_name': re.compile(
-                r'Company Name:\s*(.+?)(?:\n|$)',
-                re.IGNORECASE
-            ),
-            'registration_number': re.compile(
-                r'Registration Number:\s*(\d+)',
-                re.IGNORECASE
-            ),
-            'lei_code': re.compile(
-                r'LEI Code:\s*([A-Z0-9]{20})',
-                re.IGNORECASE
-            ),
-            'duns_number': re.compile(
-                r'DUNS Number:\s*(\d{9})',
-                re.IGNORECASE
-            ),
-            
-            # Credit metrics
-            'credit_score': re.compile(
-                r'Credit Score:\s*(\d+)\s*(?:/|out of)?\s*\d*',
-                re.IGNORECASE
-            ),
-            'credit_rating': re.compile(
-                r'Credit Rating:\s*([A-Z][A-Z+\-]*)',
-                re.IGNORECASE
-            ),
-            'credit_limit': re.compile(
-                r'Credit Limit.*?[£$€]?\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'risk_level': re.compile(
-                r'Risk Level:\s*(.+?)(?:\n|$)',
-                re.IGNORECASE
-            ),
-            
-            # Financial metrics
-            'revenue': re.compile(
-                r'Revenue.*?[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'turnover': re.compile(
-                r'Turnover.*?[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'profit': re.compile(
-                r'Profit Before Tax.*?[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'total_assets': re.compile(
-                r'Total Assets:\s*[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'total_liabilities': re.compile(
-                r'Total Liabilities:\s*[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            'net_worth': re.compile(
-                r'Net Worth:\s*[£$€]\s*([\d,]+)',
-                re.IGNORECASE
-            ),
-            
-            # Financial ratios
-            'debt_to_equity': re.compile(
-                r'Debt-to-Equity.*?(\d+\.?\d*)',
-                re.IGNORECASE
-            ),
-            'current_ratio': re.compile(
-                r'Current Ratio:\s*(\d+\.?\d*)',
-                re.IGNORECASE
-            ),
-            'profit_margin': re.compile(
-                r'Profit Margin:\s*(\d+\.?\d*)%?',
-                re.IGNORECASE
-            ),
-            
-            # Payment information
-            'payment_terms': re.compile(
-                r'Payment Terms:\s*(.+?)(?:\n|$)',
-                re.IGNORECASE
-            ),
-            'on_time_percentage': re.compile(
-                r'On-Time Payments?:\s*\d+\s*\((\d+)%\)',
-                re.IGNORECASE
-            ),
-            'average_payment_days': re.compile(
-                r'Average Payment Days:\s*(\d+)',
-                re.IGNORECASE
-            ),
-            
-            # Dates
-            'incorporation_date': re.compile(
-                r'Date of Incorporation:\s*(\d{1,2}\s+\w+\s+\d{4})',
-                re.IGNORECASE
-            ),
-            'report_date': re.compile(
-                r'Report Date:\s*(\d{1,2}\s+\w+\s+\d{4})',
-                re.IGNORECASE
-            ),
-        }
-    
-    
     def extract_all(self, text: str) -> Dict:
         """
         Extract all available financial data from text.
@@ -159,14 +268,16 @@ class DataExtractor:
         
         print("\n🔍 Starting data extraction...")
         
-        extracted = {
-            'extraction_timestamp': datetime.now().isoformat(),
-            'company_info': self._extract_company_info(text),
-            'credit_metrics': self._extract_credit_metrics(text),
-            'financial_data': self._extract_financial_data(text),
-            'payment_info': self._extract_payment_info(text),
-            'dates': self._extract_dates(text),
-        }
+        found = self._find_fields(text)
+        
+        extracted = {'extraction_timestamp': datetime.now().isoformat()}
+        for category in _CATEGORIES:
+            extracted[category] = {}
+        
+        # _FIELDS order decides precedence (e.g. Revenue over Turnover)
+        for name, (category, key, convert, _) in _FIELDS.items():
+            if name in found and key not in extracted[category]:
+                extracted[category][key] = convert(found[name])
         
         # Count successful extractions
         total_fields = self._count_extracted_fields(extracted)
@@ -180,163 +291,58 @@ class DataExtractor:
         return extracted
     
     
-    def _extract_company_info(self, text: str) -> Dict:
-        """Extract company identification information."""
-        info = {}
-        
-        # Company name
-        match = self.patterns['company_name'].search(text)
-        if match:
-            info['company_name'] = match.group(1).strip()
-        
-        # Registration number
-        match = self.patterns['registration_number'].search(text)
-        if match:
-            info['registration_number'] = match.group(1)
-        
-        # LEI Code
-        match = self.patterns['lei_code'].search(text)
-        if match:
-            info['lei_code'] = match.group(1)
-        
-        # DUNS Number
-        match = self.patterns['duns_number'].search(text)
-        if match:
-            info['duns_number'] = match.group(1)
-        
-        return info
-    
-    
-    def _extract_credit_metrics(self, text: str) -> Dict:
-        """Extract credit-related metrics."""
-        metrics = {}
-        
-        # Credit score
-        match = self.patterns['credit_score'].search(text)
-        if match:
-            metrics['credit_score'] = int(match.group(1))
-        
-        # Credit rating
-        match = self.patterns['credit_rating'].search(text)
-        if match:
-            metrics['credit_rating'] = match.group(1)
-        
-        # Credit limit
-        match = self.patterns['credit_limit'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            metrics['credit_limit'] = float(value)
-        
-        # Risk level
-        match = self.patterns['risk_level'].search(text)
-        if match:
-            metrics['risk_level'] = match.group(1).strip()
-        
-        return metrics
-    
-    
-    def _extract_financial_data(self, text: str) -> Dict:
-        """Extract financial metrics and ratios."""
-        data = {}
-        
-        # Revenue (try both Revenue and Turnover)
-        match = self.patterns['revenue'].search(text)
-        if not match:
-            match = self.patterns['turnover'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            data['revenue'] = float(value)
-        
-        # Profit
-        match = self.patterns['profit'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            data['profit'] = float(value)
-        
-        # Total Assets
-        match = self.patterns['total_assets'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            data['total_assets'] = float(value)
-        
-        # Total Liabilities
-        match = self.patterns['total_liabilities'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            data['total_liabilities'] = float(value)
-        
-        # Net Worth
-        match = self.patterns['net_worth'].search(text)
-        if match:
-            value = match.group(1).replace(',', '')
-            data['net_worth'] = float(value)
-        
-        # Debt-to-Equity Ratio
-        match = self.patterns['debt_to_equity'].search(text)
-        if match:
-            data['debt_to_equity'] = float(match.group(1))
-        
-        # Current Ratio
-        match = self.patterns['current_ratio'].search(text)
-        if match:
-            data['current_ratio'] = float(match.group(1))
-        
-        # Profit Margin
-        match = self.patterns['profit_margin'].search(text)
-        if match:
-            data['profit_margin'] = float(match.group(1))
-        
-        return data
-    
-    
-    def _extract_payment_info(self, text: str) -> Dict:
-        """Extract payment-related information."""
-        info = {}
-        
-        # Payment terms
-        match = self.patterns['payment_terms'].search(text)
-        if match:
-            info['payment_terms'] = match.group(1).strip()
-        
-        # On-time payment percentage
-        match = self.patterns['on_time_percentage'].search(text)
-        if match:
-            info['on_time_percentage'] = int(match.group(1))
-        
-        # Average payment days
-        match = self.patterns['average_payment_days'].search(text)
-        if match:
-            info['average_payment_days'] = int(match.group(1))
-        
-        return info
-    
-    
-    def _extract_dates(self, text: str) -> Dict:
-        """Extract important dates."""
-        dates = {}
-        
-        # Incorporation date
-        match = self.patterns['incorporation_date'].search(text)
-        if match:
-            dates['incorporation_date'] = match.group(1)
-        
-        # Report date
-        match = self.patterns['report_date'].search(text)
-        if match:
-            dates['report_date'] = match.group(1)
+    def _find_fields(self, text: str) -> Dict[str, str]:
+        """
+        Find the raw matched value of every field present in the text.
         
-        return dates
+        Returns:
+            Dictionary of pattern name -> first matched value
+        """
+        found = {}
+        
+        # Cheap screen: every pattern starts with one of these labels, so
+        # if none occur there is nothing to extract
+        lowered = text.lower()
+        if not any(signifier in lowered for signifier in _SIGNIFIERS):
+            return found
+        
+        # Fixed labels, fast path: hash lookup on the text before each line's
+        # first colon. A hit only counts if the label doesn't occur anywhere
+        # earlier in the text; otherwise an earlier match may exist
+        offset = 0
+        for line, lowered_line in zip(text.split('\n'), lowered.split('\n')):
+            label, sep, _ = lowered_line.partition(':')
+            if sep:
+                label = label.strip()
+                name = _LABEL_FIELDS.get(label)
+                if name and name not in found and lowered.find(label) >= offset:
+                    match = _PATTERNS[name].search(line)
+                    if match:
+                        found[name] = match.group(1)
+            offset += len(lowered_line) + 1
+        
+        # Fixed labels the fast path missed: search with the field's pattern
+        for label, name in _LABEL_FIELDS.items():
+            if name not in found and label in lowered:
+                match = _PATTERNS[name].search(text)
+                if match:
+                    found[name] = match.group(1)
+        
+        # Everything else: the field's own pattern. Searching the fields
+        # separately (rather than one merged alternation) means a match can't
+        # swallow another field later on the same line, e.g. "Revenue growth
+        # strong. Profit Before Tax: £20,000"
+        for name in _SCAN_FIELDS:
+            match = _PATTERNS[name].search(text)
+            if match:
+                found[name] = match.group(1)
+        
+        return found
     
     
     def _count_extracted_fields(self, extracted: Dict) -> int:
         """Count total number of successfully extracted fields."""
-        count = 0
-        
-        for category in ['company_info', 'credit_metrics', 'financial_data', 'payment_info', 'dates']:
-            if category in extracted:
-                count += len(extracted[category])
-        
-        return count
+        return sum(len(extracted.get(category, ())) for category in _CATEGORIES)
     
     
     def format_for_display(self, extracted: Dict) -> str:
@@ -349,69 +355,34 @@ class DataExtractor:
         Returns:
             Formatted string
         """
-        lines = []
-        lines.append("=" * 80)
-        lines.append("EXTRACTED FINANCIAL DATA")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # Company Information
-        if extracted.get('company_info'):
-            lines.append("📊 COMPANY INFORMATION")
-            lines.append("-" * 80)
-            for key, value in extracted['company_info'].items():
-                label = key.replace('_', ' ').title()
-                lines.append(f"  {label}: {value}")
-            lines.append("")
-        
-        # Credit Metrics
-        if extracted.get('credit_metrics'):
-            lines.append("💳 CREDIT METRICS")
-            lines.append("-" * 80)
-            for key, value in extracted['credit_metrics'].items():
-                label = key.replace('_', ' ').title()
-                if 'limit' in key and isinstance(value, (int, float)):
-                    lines.append(f"  {label}: £{value:,.0f}")
-                else:
-                    lines.append(f"  {label}: {value}")
-            lines.append("")
-        
-        # Financial Data
-        if extracted.get('financial_data'):
-            lines.append("💰 FINANCIAL DATA")
-            lines.append("-" * 80)
-            for key, value in extracted['financial_data'].items():
-                label = key.replace('_', ' ').title()
-                if isinstance(value, float) and value > 1000:
-                    lines.append(f"  {label}: £{value:,.0f}")
-                else:
-                    lines.append(f"  {label}: {value}")
-            lines.append("")
-        
-        # Payment Information
-        if extracted.get('payment_info'):
-            lines.append("💳 PAYMENT INFORMATION")
-            lines.append("-" * 80)
-            for key, value in extracted['payment_info'].items():
-                label = key.replace('_', ' ').title()
-                if 'percentage' in key:
-                    lines.append(f"  {label}: {value}%")
-                else:
-                    lines.append(f"  {label}: {value}")
-            lines.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write(_RULE)
+        write("EXTRACTED FINANCIAL DATA\n")
+        write(_RULE)
+        write("\n")
+        
+        for category, heading in _DISPLAY_SECTIONS:
+            if extracted.get(category):
+                write(heading)
+                write(_SUBRULE)
+                for key, value in extracted[category].items():
+                    label, fmt = _DISPLAY.get(key, (key, str))
+                    write(f"  {label}: {fmt(value)}\n")
+                write("\n")
         
         # Summary
         if extracted.get('extraction_summary'):
-            lines.append("📈 EXTRACTION SUMMARY")
-            lines.append("-" * 80)
+            write("📈 EXTRACTION SUMMARY\n")
+            write(_SUBRULE)
             summary = extracted['extraction_summary']
-            lines.append(f"  Total Fields Extracted: {summary['total_fields_extracted']}")
-            lines.append(f"  Extraction Status: {'✅ Complete' if summary['extraction_complete'] else '❌ Failed'}")
+            write(f"  Total Fields Extracted: {summary['total_fields_extracted']}\n")
+            write(f"  Extraction Status: {'✅ Complete' if summary['extraction_complete'] else '❌ Failed'}\n")
         
-        lines.append("")
-        lines.append("=" * 80)
+        write("\n")
+        write("=" * 80)
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     
     def format_for_duckdb(self, extracted: Dict, document_id: int = None) -> Dict:
@@ -462,8 +433,14 @@ def main():
         print("   Please run document_processor.py first to extract text")
         return
     
-    with open(sample_file, 'r', encoding='utf-8') as f:
-        text = f.read()
+    # Decode straight from a memory map of the file, skipping the
+    # intermediate bytes copy a plain read() makes (mmap rejects empty files)
+    with open(sample_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            text = ''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
     
     # Extract data
     extracted = extractor.extract_all(text)
@@ -471,14 +448,17 @@ def main():
     # Display results
     print("\n" + extractor.format_for_display(extracted))
     
+    # Serialize once for both the console and the file
+    json_bytes = orjson.dumps(extracted, option=orjson.OPT_INDENT_2)
+    
     # Show JSON structure
     print("\n📄 JSON Structure:")
-    print(json.dumps(extracted, indent=2, default=str))
+    print(json_bytes.decode('utf-8'))
     
     # Save to file
     output_file = Path("data/processed/extracted_data.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dumps(extracted, f, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(json_bytes)
     
     print(f"\n💾 Saved to: {output_file}")
     print("\n✅ Test complete!")
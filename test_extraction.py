@@ -6,12 +6,6 @@ Quick Demo - Test Data Extraction
 This script demonstrates the data extractor with sample text.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
-
 from src.data_extractor import DataExtractor
 
 # Sample credit report text (abbreviated)
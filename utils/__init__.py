@@ -0,0 +1 @@
+"""FinDoc Intelligence - database and support utilities."""
@@ -11,13 +11,41 @@ Author: Built for FinDoc Intelligence project
 """
 
 import sqlite3
+import threading
 import duckdb
+import pyarrow as pa
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import json
 
 
+# Arrow schema for bulk inserts, matching the financial_metrics data columns
+_METRICS_SCHEMA = pa.schema([
+    ('document_id', pa.int32()),
+    ('company_name', pa.string()),
+    ('registration_number', pa.string()),
+    ('lei_code', pa.string()),
+    ('duns_number', pa.string()),
+    ('credit_score', pa.float64()),
+    ('credit_rating', pa.string()),
+    ('revenue', pa.float64()),
+    ('profit', pa.float64()),
+    ('total_assets', pa.float64()),
+    ('total_liabilities', pa.float64()),
+    ('debt_to_equity', pa.float64()),
+    ('current_ratio', pa.float64()),
+])
+
+# financial_metrics data columns, and the single-row INSERT over all of them
+_FIN_COLS = tuple(_METRICS_SCHEMA.names)
+_FIN_INSERT = f"""
+    INSERT INTO financial_metrics (id, {','.join(_FIN_COLS)})
+    VALUES (nextval('financial_metrics_id_seq'), {','.join('?' * len(_FIN_COLS))})
+    RETURNING id
+"""
+
+
 class DatabaseManager:
     """
     Manages all database operations for the application.
@@ -33,8 +61,13 @@ class DatabaseManager:
         self.db_dir = Path(db_dir)
         self.db_dir.mkdir(parents=True, exist_ok=True)
         
-        # SQLite for conversations
+        # SQLite for conversations: one connection for the manager's lifetime,
+        # shared by the app's threads (the lock serialises access)
         self.sqlite_path = self.db_dir / "conversations.db"
+        self.sqlite_conn = sqlite3.connect(
+            self.sqlite_path, check_same_thread=False, isolation_level=None
+        )
+        self._sqlite_lock = threading.Lock()
         self.init_sqlite()
         
         # DuckDB for financial analytics
@@ -47,8 +80,13 @@ class DatabaseManager:
     
     def init_sqlite(self):
         """Initialize SQLite database with required tables."""
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
+        cursor = self.sqlite_conn.cursor()
+        
+        # WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
         
         # Create conversations table
         cursor.execute("""
@@ -76,8 +114,25 @@ class DatabaseManager:
             )
         """)
         
-        conn.commit()
-        conn.close()
+        # Indexes for the per-session history and recent-documents queries
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conv_session_ts
+            ON conversations (session_id, timestamp DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_docs_upload_ts
+            ON documents (upload_timestamp DESC)
+        """)
+        
+        # Create OCR cache table (text keyed by image content hash)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_cache (
+                hash TEXT PRIMARY KEY,
+                text TEXT,
+                created DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
         print("✅ SQLite tables initialized")
     
     
@@ -105,6 +160,14 @@ class DatabaseManager:
             )
         """)
         
+        # Row ids come from a sequence, started past any rows already stored
+        next_id = self.duckdb_conn.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM financial_metrics"
+        ).fetchone()[0]
+        self.duckdb_conn.execute(
+            f"CREATE SEQUENCE IF NOT EXISTS financial_metrics_id_seq START {next_id}"
+        )
+        
         print("✅ DuckDB tables initialized")
     
     
@@ -133,20 +196,14 @@ class DatabaseManager:
         Returns:
             Conversation ID
         """
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO conversations 
-            (session_id, user_message, assistant_message, document_name, message_type)
-            VALUES (?, ?, ?, ?, ?)
-        """, (session_id, user_message, assistant_message, document_name, message_type))
-        
-        conversation_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return conversation_id
+        with self._sqlite_lock:
+            cursor = self.sqlite_conn.execute("""
+                INSERT INTO conversations 
+                (session_id, user_message, assistant_message, document_name, message_type)
+                VALUES (?, ?, ?, ?, ?)
+            """, (session_id, user_message, assistant_message, document_name, message_type))
+        
+        return cursor.lastrowid
     
     
     def get_conversation_history(
@@ -164,19 +221,20 @@ class DatabaseManager:
         Returns:
             List of conversation dictionaries
         """
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT timestamp, user_message, assistant_message, document_name, message_type
-            FROM conversations
-            WHERE session_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (session_id, limit))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        # Latest `limit` messages, returned oldest first (id breaks ties
+        # between messages saved within the same second)
+        with self._sqlite_lock:
+            rows = self.sqlite_conn.execute("""
+                SELECT timestamp, user_message, assistant_message, document_name, message_type
+                FROM (
+                    SELECT id, timestamp, user_message, assistant_message, document_name, message_type
+                    FROM conversations
+                    WHERE session_id = ?
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT ?
+                )
+                ORDER BY timestamp ASC, id ASC
+            """, (session_id, limit)).fetchall()
         
         # Convert to list of dicts
         history = []
@@ -189,18 +247,14 @@ class DatabaseManager:
                 'message_type': row[4]
             })
         
-        return list(reversed(history))  # Return in chronological order
+        return history
     
     
     def clear_session_history(self, session_id: str):
         """Clear all conversations for a session."""
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM conversations WHERE session_id = ?", (session_id,))
+        with self._sqlite_lock:
+            self.sqlite_conn.execute("DELETE FROM conversations WHERE session_id = ?", (session_id,))
         
-        conn.commit()
-        conn.close()
         print(f"🗑️ Cleared history for session: {session_id}")
     
     
@@ -227,36 +281,25 @@ class DatabaseManager:
         Returns:
             Document ID
         """
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO documents 
-            (filename, file_type, text_length, document_type, processed)
-            VALUES (?, ?, ?, ?, 1)
-        """, (filename, file_type, text_length, document_type))
-        
-        doc_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return doc_id
+        with self._sqlite_lock:
+            cursor = self.sqlite_conn.execute("""
+                INSERT INTO documents 
+                (filename, file_type, text_length, document_type, processed)
+                VALUES (?, ?, ?, ?, 1)
+            """, (filename, file_type, text_length, document_type))
+        
+        return cursor.lastrowid
     
     
     def get_uploaded_documents(self, limit: int = 20) -> List[Dict]:
         """Get list of uploaded documents."""
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, filename, file_type, upload_timestamp, document_type
-            FROM documents
-            ORDER BY upload_timestamp DESC
-            LIMIT ?
-        """, (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._sqlite_lock:
+            rows = self.sqlite_conn.execute("""
+                SELECT id, filename, file_type, upload_timestamp, document_type
+                FROM documents
+                ORDER BY upload_timestamp DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
         
         documents = []
         for row in rows:
@@ -271,6 +314,43 @@ class DatabaseManager:
         return documents
     
     
+    # ============================================================
+    # OCR CACHE (SQLite)
+    # ============================================================
+    
+    def get_ocr_cached(self, image_hash: str) -> Optional[str]:
+        """
+        Look up previously extracted OCR text.
+        
+        Args:
+            image_hash: Content hash of the image file
+            
+        Returns:
+            Cached text, or None if the image hasn't been seen
+        """
+        with self._sqlite_lock:
+            row = self.sqlite_conn.execute(
+                "SELECT text FROM ocr_cache WHERE hash = ?", (image_hash,)
+            ).fetchone()
+        
+        return row[0] if row else None
+    
+    
+    def put_ocr_cached(self, image_hash: str, text: str):
+        """
+        Store OCR text for an image.
+        
+        Args:
+            image_hash: Content hash of the image file
+            text: Extracted text
+        """
+        with self._sqlite_lock:
+            self.sqlite_conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (hash, text) VALUES (?, ?)",
+                (image_hash, text)
+            )
+    
+    
     # ============================================================
     # FINANCIAL DATA MANAGEMENT (DuckDB)
     # ============================================================
@@ -285,59 +365,58 @@ class DatabaseManager:
         Returns:
             Row ID
         """
-        # Build INSERT query dynamically based on available metrics
-        columns = []
-        values = []
-        
-        metric_mapping = {
-            'document_id': 'document_id',
-            'company_name': 'company_name',
-            'registration_number': 'registration_number',
-            'lei_code': 'lei_code',
-            'duns_number': 'duns_number',
-            'credit_score': 'credit_score',
-            'credit_rating': 'credit_rating',
-            'revenue': 'revenue',
-            'profit': 'profit',
-            'total_assets': 'total_assets',
-            'total_liabilities': 'total_liabilities',
-            'debt_to_equity': 'debt_to_equity',
-            'current_ratio': 'current_ratio'
-        }
-        
-        for key, col_name in metric_mapping.items():
-            if key in metrics and metrics[key] is not None:
-                columns.append(col_name)
-                values.append(metrics[key])
-        
-        if not columns:
+        # Missing metrics are bound as NULL
+        values = [metrics.get(column) for column in _FIN_COLS]
+        
+        if all(value is None for value in values):
             return -1
         
-        placeholders = ','.join(['?' for _ in columns])
-        query = f"""
-            INSERT INTO financial_metrics ({','.join(columns)})
-            VALUES ({placeholders})
+        return self.duckdb_conn.execute(_FIN_INSERT, values).fetchone()[0]
+    
+    
+    def save_financial_metrics_bulk(self, metrics_list: List[Dict]) -> int:
         """
+        Save many sets of financial metrics in one INSERT.
         
-        self.duckdb_conn.execute(query, values)
+        Args:
+            metrics_list: Dictionaries of financial metrics (as for
+                save_financial_metrics; missing metrics are stored as NULL)
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not metrics_list:
+            return 0
         
-        # Get last inserted ID
-        result = self.duckdb_conn.execute("SELECT MAX(id) FROM financial_metrics").fetchone()
-        return result[0] if result else -1
+        # DuckDB scans the registered Arrow table directly, no per-row binding
+        table = pa.Table.from_pylist(metrics_list, schema=_METRICS_SCHEMA)
+        columns = ','.join(_FIN_COLS)
+        
+        self.duckdb_conn.register("tmp_metrics", table)
+        try:
+            self.duckdb_conn.execute(f"""
+                INSERT INTO financial_metrics (id, {columns})
+                SELECT nextval('financial_metrics_id_seq'), {columns} FROM tmp_metrics
+            """)
+        finally:
+            self.duckdb_conn.unregister("tmp_metrics")
+        
+        return table.num_rows
     
     
-    def query_financial_data(self, sql_query: str) -> Tuple[List, List]:
+    def query_financial_data(self, sql_query: str, params: Optional[List] = None) -> Tuple[List, List]:
         """
         Execute SQL query on financial data.
         
         Args:
             sql_query: SQL query string
+            params: Values for ? placeholders in the query (optional)
             
         Returns:
             Tuple of (column_names, rows)
         """
         try:
-            result = self.duckdb_conn.execute(sql_query).fetchall()
+            result = self.duckdb_conn.execute(sql_query, params).fetchall()
             columns = [desc[0] for desc in self.duckdb_conn.description]
             return columns, result
         except Exception as e:
@@ -347,7 +426,7 @@ class DatabaseManager:
     
     def get_financial_summary(self, limit: int = 10) -> List[Dict]:
         """Get summary of all financial records."""
-        query = f"""
+        query = """
             SELECT 
                 company_name,
                 credit_score,
@@ -357,10 +436,10 @@ class DatabaseManager:
                 extracted_date
             FROM financial_metrics
             ORDER BY extracted_date DESC
-            LIMIT {limit}
+            LIMIT ?
         """
         
-        columns, rows = self.query_financial_data(query)
+        columns, rows = self.query_financial_data(query, [limit])
         
         summary = []
         for row in rows:
@@ -371,6 +450,8 @@ class DatabaseManager:
     
     def close(self):
         """Close all database connections."""
+        if hasattr(self, 'sqlite_conn'):
+            self.sqlite_conn.close()
         if hasattr(self, 'duckdb_conn'):
             self.duckdb_conn.close()
         print("🔒 Database connections closed")